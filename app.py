@@ -1,13 +1,17 @@
 from __future__ import annotations
 
 import csv
+import functools
 import hashlib
 import json
 import os
 import re
+import shutil
 import threading
 import time
 import warnings
+from bisect import bisect_right
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Dict, List, Optional
@@ -15,7 +19,9 @@ from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
-from flask import Flask, jsonify, request
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from flask import Flask, request
 from flask_cors import CORS
 from langdetect import DetectorFactory, detect
 from langdetect.lang_detect_exception import LangDetectException
@@ -25,6 +31,30 @@ try:
 except Exception:
     genai = None
 
+try:
+    import fasttext
+except Exception:
+    fasttext = None
+
+try:
+    import orjson
+except Exception:
+    orjson = None
+
+try:
+    import xxhash
+except Exception:
+    xxhash = None
+
+try:
+    from lxml import etree as lxml_etree
+    from lxml import html as lxml_html
+    from lxml.cssselect import CSSSelector
+except Exception:
+    lxml_etree = None
+    lxml_html = None
+    CSSSelector = None
+
 warnings.filterwarnings("ignore", category=FutureWarning)
 DetectorFactory.seed = 0
 
@@ -40,6 +70,8 @@ DASHBOARD_OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
 REFRESH_INTERVAL_SECONDS = int(os.getenv("REFRESH_INTERVAL_SECONDS", "5"))
 MAX_PAGES_PER_SCRAPE = int(os.getenv("MAX_PAGES_PER_SCRAPE", "50"))
 REQUEST_TIMEOUT_SECONDS = float(os.getenv("REQUEST_TIMEOUT_SECONDS", "30"))
+SCRAPE_CONCURRENCY = int(os.getenv("SCRAPE_CONCURRENCY", "8"))
+MAX_RESPONSE_BYTES = int(os.getenv("MAX_RESPONSE_BYTES", str(5 * 1024 * 1024)))
 
 REQUEST_HEADERS = {
     "User-Agent": (
@@ -51,6 +83,18 @@ REQUEST_HEADERS = {
     "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
 }
 
+# Shared session so the ~50 sequential page/AJAX requests per scrape reuse
+# one keep-alive connection instead of a fresh TCP+TLS handshake each time.
+_HTTP = requests.Session()
+_HTTP.headers.update(REQUEST_HEADERS)
+_http_adapter = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504]),
+)
+_HTTP.mount("https://", _http_adapter)
+_HTTP.mount("http://", _http_adapter)
+
 SITE_CONFIG = {
     "site1": {
         "name": "Mann Ki Baat (English)",
@@ -81,18 +125,22 @@ LANGUAGE_CODE_MAP = {
     "ur": "Urdu",
 }
 
-SCRIPT_PATTERNS = [
-    (re.compile(r"[\u0900-\u097F]"), "Hindi"),
-    (re.compile(r"[\u0980-\u09FF]"), "Bengali"),
-    (re.compile(r"[\u0A00-\u0A7F]"), "Punjabi"),
-    (re.compile(r"[\u0A80-\u0AFF]"), "Gujarati"),
-    (re.compile(r"[\u0B00-\u0B7F]"), "Odia"),
-    (re.compile(r"[\u0B80-\u0BFF]"), "Tamil"),
-    (re.compile(r"[\u0C00-\u0C7F]"), "Telugu"),
-    (re.compile(r"[\u0C80-\u0CFF]"), "Kannada"),
-    (re.compile(r"[\u0D00-\u0D7F]"), "Malayalam"),
-    (re.compile(r"[\u0600-\u06FF]"), "Urdu"),
-]
+# Sorted, non-overlapping codepoint ranges so script detection is one pass
+# over the string with a bisect per non-ASCII char, instead of one regex
+# scan per script.
+SCRIPT_RANGES = (
+    (0x0600, 0x06FF, "Urdu"),
+    (0x0900, 0x097F, "Hindi"),
+    (0x0980, 0x09FF, "Bengali"),
+    (0x0A00, 0x0A7F, "Punjabi"),
+    (0x0A80, 0x0AFF, "Gujarati"),
+    (0x0B00, 0x0B7F, "Odia"),
+    (0x0B80, 0x0BFF, "Tamil"),
+    (0x0C00, 0x0C7F, "Telugu"),
+    (0x0C80, 0x0CFF, "Kannada"),
+    (0x0D00, 0x0D7F, "Malayalam"),
+)
+_SCRIPT_RANGE_STARTS = [start for start, _, _ in SCRIPT_RANGES]
 
 POSITIVE_WORDS = {
     "good",
@@ -139,6 +187,22 @@ NEGATIVE_WORDS = {
     "delay",
 }
 
+# One compiled DFA scan per polarity replaces a Python-level loop doing two
+# set lookups per token. Longest-first alternation keeps matches greedy.
+_POSITIVE_WORDS_RE = re.compile(
+    r"\b(?:" + "|".join(sorted(POSITIVE_WORDS, key=len, reverse=True)) + r")\b"
+)
+_NEGATIVE_WORDS_RE = re.compile(
+    r"\b(?:" + "|".join(sorted(NEGATIVE_WORDS, key=len, reverse=True)) + r")\b"
+)
+_NEGATED_POSITIVE_RE = re.compile(r"\b(not|no|never)\s+(good|great|excellent|super|nice)\b")
+_NEGATED_NEGATIVE_RE = re.compile(r"\b(not|no|never)\s+(bad|poor|waste|worst)\b")
+
+# Single codepoints only (the U+FE0F variation selector is irrelevant), so
+# emoji scoring is one pass over the text instead of one str.count per emoji.
+_POSITIVE_EMOJI = frozenset("😀😄😊👍❤🔥👏🙏")
+_NEGATIVE_EMOJI = frozenset("😡😞👎💔😢😭")
+
 PLACEHOLDER_AUTHORS = {
     "",
     "unknown",
@@ -153,6 +217,32 @@ JUNK_PATTERNS = [
     re.compile(r"^report\s+spam", re.IGNORECASE),
 ]
 
+_WHITESPACE_RE = re.compile(r"\s+")
+_LATIN_LETTER_RE = re.compile(r"[A-Za-z]")
+_ANY_SCRIPT_LETTER_RE = re.compile(r"[a-zA-Z\u0900-\u0D7F]")
+_JSON_FENCE_OPEN_RE = re.compile(r"^```(?:json)?", re.IGNORECASE)
+_JSON_FENCE_CLOSE_RE = re.compile(r"```$")
+_JSON_ARRAY_RE = re.compile(r"\[.*\]", re.DOTALL)
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+_DRUPAL_SETTINGS_RE = re.compile(r"jQuery\.extend\(Drupal\.settings,\s*(\{.*?\})\s*\);", re.DOTALL)
+
+COMMENT_ARTICLE_SELECTOR = "article.comment_row, article.comment"
+COMMENT_BODY_SELECTOR = "div.comment_body"
+COMMENT_USER_SELECTOR = "span.username, .username, .comment_user, .user-name"
+COMMENT_TIME_SELECTOR = "time, span.timeago, .submitted, .comment_date, .comment-time"
+
+# CSS-to-XPath translation is not free; compile the selectors once so each
+# AJAX fragment pays only the C-level tree walk.
+if CSSSelector is not None:
+    _SEL_ARTICLE = CSSSelector(COMMENT_ARTICLE_SELECTOR)
+    _SEL_BODY = CSSSelector(COMMENT_BODY_SELECTOR)
+    _SEL_USER = CSSSelector(COMMENT_USER_SELECTOR)
+    _SEL_TIME = CSSSelector(COMMENT_TIME_SELECTOR)
+    _NODE_TEXT_XPATH = lxml_etree.XPath("string()")
+    _PRECEDING_USERNAME_XPATH = lxml_etree.XPath(
+        "preceding::span[contains(concat(' ', normalize-space(@class), ' '), ' username ')][1]"
+    )
+
 DEFAULT_SENTIMENT_SCORE = {
     "positive": 0.62,
     "negative": 0.62,
@@ -174,10 +264,20 @@ _gemini_model = None
 _gemini_model_lock = threading.Lock()
 _gemini_enabled = bool(os.getenv("GEMINI_API_KEY") or os.getenv("GOOGLE_API_KEY")) and genai is not None
 _gemini_model_name = os.getenv("GEMINI_MODEL", "gemini-1.5-flash")
+GEMINI_BATCH_SIZE = int(os.getenv("GEMINI_BATCH_SIZE", "25"))
+
+FASTTEXT_MODEL_PATH = os.getenv("FASTTEXT_LID_MODEL", str(Path(__file__).resolve().parent / "lid.176.ftz"))
+_fasttext_model = None
+_fasttext_model_lock = threading.Lock()
+_fasttext_enabled = fasttext is not None
 
 _analysis_cache: Dict[str, Dict] = {}
 _analysis_cache_lock = threading.Lock()
 
+VIEW_PARAMS_TTL_SECONDS = float(os.getenv("VIEW_PARAMS_TTL_SECONDS", "3600"))
+_view_params_cache: Dict[str, tuple] = {}
+_view_params_cache_lock = threading.Lock()
+
 _state_lock = threading.Lock()
 _site_states: Dict[str, Dict] = {
     source_id: {
@@ -207,12 +307,37 @@ def dashboard_raw_csv_path(source_id: str) -> Path:
     return DASHBOARD_OUTPUT_DIR / SITE_CONFIG[source_id]["raw_csv"]
 
 
+def json_loads(data):
+    """Parse JSON with orjson when available, else the stdlib."""
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except Exception:
+            pass
+    return json.loads(data)
+
+
+def json_dumps_bytes(payload) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def json_response(payload):
+    """Serialize an API payload with orjson when available, else jsonify."""
+    return app.response_class(json_dumps_bytes(payload), mimetype="application/json")
+
+
 def normalize_whitespace(value: str) -> str:
-    return re.sub(r"\s+", " ", str(value or "")).strip()
+    return _WHITESPACE_RE.sub(" ", str(value or "")).strip()
 
 
 def text_hash(value: str) -> str:
-    return hashlib.sha256(value.encode("utf-8", errors="ignore")).hexdigest()
+    """Fast non-cryptographic digest; keys only ever feed dicts and sets."""
+    data = value.encode("utf-8", errors="ignore")
+    if xxhash is not None:
+        return xxhash.xxh3_128_hexdigest(data)
+    return hashlib.sha256(data).hexdigest()
 
 
 def safe_float(value, default=0.0) -> float:
@@ -251,18 +376,19 @@ def is_placeholder_author(author: str) -> bool:
 
 
 def is_junk_or_boilerplate(text: str) -> bool:
-    cleaned = normalize_whitespace(text)
-    if not cleaned:
+    """Expects text already cleaned by fix_mojibake / normalize_whitespace."""
+    if not text:
         return True
-    if len(cleaned) < 3:
+    if len(text) < 3:
         return True
     for pattern in JUNK_PATTERNS:
-        if pattern.search(cleaned):
+        if pattern.search(text):
             return True
     return False
 
 
 def fix_mojibake(text: str) -> str:
+    """Repair latin1/utf-8 mojibake; output is always whitespace-normalized."""
     cleaned = normalize_whitespace(text)
     if not cleaned:
         return ""
@@ -275,15 +401,24 @@ def fix_mojibake(text: str) -> str:
     return cleaned
 
 
+@functools.lru_cache(maxsize=2048)
 def detect_language_from_script(text: str) -> str:
-    for pattern, language in SCRIPT_PATTERNS:
-        if pattern.search(text):
-            return language
-    if re.search(r"[A-Za-z]", text):
+    has_latin = False
+    for ch in text:
+        cp = ord(ch)
+        if cp < 0x0600:
+            if not has_latin and ("a" <= ch <= "z" or "A" <= ch <= "Z"):
+                has_latin = True
+            continue
+        index = bisect_right(_SCRIPT_RANGE_STARTS, cp) - 1
+        if index >= 0 and cp <= SCRIPT_RANGES[index][1]:
+            return SCRIPT_RANGES[index][2]
+    if has_latin:
         return "English"
     return "Unknown"
 
 
+@functools.lru_cache(maxsize=2048)
 def normalize_language_name(raw: str) -> str:
     value = normalize_whitespace(raw)
     if not value:
@@ -297,28 +432,66 @@ def normalize_language_name(raw: str) -> str:
     return value
 
 
-def detect_language_name(text: str) -> str:
-    cleaned = normalize_whitespace(text)
+def get_fasttext_model():
+    """Lazily load the fastText lid.176 model; returns None when unavailable."""
+    global _fasttext_model, _fasttext_enabled
+    if not _fasttext_enabled:
+        return None
+
+    if _fasttext_model is not None:
+        return _fasttext_model
+
+    with _fasttext_model_lock:
+        if _fasttext_model is not None:
+            return _fasttext_model
+        try:
+            _fasttext_model = fasttext.load_model(FASTTEXT_MODEL_PATH)
+        except Exception:
+            _fasttext_enabled = False
+            return None
+        return _fasttext_model
+
+
+@functools.lru_cache(maxsize=2048)
+def detect_language_name(cleaned: str) -> str:
+    """Expects text already cleaned by fix_mojibake / normalize_whitespace."""
     if not cleaned:
         return "Unknown"
 
     script_guess = detect_language_from_script(cleaned)
-
-    try:
-        code = detect(cleaned)
-        mapped = LANGUAGE_CODE_MAP.get(code.lower())
-        if mapped:
-            return mapped
-    except LangDetectException:
-        pass
-    except Exception:
-        pass
+    if script_guess not in ("English", "Unknown"):
+        # A non-Latin Indic/Arabic script identifies the language outright;
+        # running a statistical detector on top can only misclassify it.
+        return script_guess
+
+    # fastText's compiled predictor is orders of magnitude faster than
+    # langdetect, which stays as the fallback when the model is missing.
+    model = get_fasttext_model()
+    if model is not None:
+        try:
+            labels, _ = model.predict(cleaned.replace("\n", " "), k=1)
+            code = labels[0].replace("__label__", "")
+            mapped = LANGUAGE_CODE_MAP.get(code.lower())
+            if mapped:
+                return mapped
+        except Exception:
+            pass
+    else:
+        try:
+            code = detect(cleaned)
+            mapped = LANGUAGE_CODE_MAP.get(code.lower())
+            if mapped:
+                return mapped
+        except LangDetectException:
+            pass
+        except Exception:
+            pass
 
     return normalize_language_name(script_guess)
 
 
-def short_summary(text: str, max_chars: int = 220) -> str:
-    cleaned = normalize_whitespace(text)
+def short_summary(cleaned: str, max_chars: int = 220) -> str:
+    """Expects text already cleaned by fix_mojibake / normalize_whitespace."""
     if len(cleaned) <= max_chars:
         return cleaned
     cut = cleaned[: max_chars - 3]
@@ -346,8 +519,9 @@ def get_gemini_model():
         return _gemini_model
 
 
-def heuristic_sentiment(text: str) -> Dict:
-    cleaned = normalize_whitespace(text)
+@functools.lru_cache(maxsize=2048)
+def heuristic_sentiment(cleaned: str) -> Dict:
+    """Expects text already cleaned by fix_mojibake / normalize_whitespace."""
     if not cleaned:
         return {
             "sentiment": "unknown",
@@ -361,22 +535,15 @@ def heuristic_sentiment(text: str) -> Dict:
             "sentiment_score": DEFAULT_SENTIMENT_SCORE["unknown"],
         }
 
-    words = re.findall(r"[a-zA-Z']+", lowered)
-    pos = 0.0
-    neg = 0.0
-
-    for token in words:
-        if token in POSITIVE_WORDS:
-            pos += 1.0
-        if token in NEGATIVE_WORDS:
-            neg += 1.0
+    pos = float(len(_POSITIVE_WORDS_RE.findall(lowered)))
+    neg = float(len(_NEGATIVE_WORDS_RE.findall(lowered)))
 
-    pos += sum(lowered.count(x) for x in ["😀", "😄", "😊", "👍", "❤️", "❤", "🔥", "👏", "🙏"]) * 0.5
-    neg += sum(lowered.count(x) for x in ["😡", "😞", "👎", "💔", "😢", "😭"]) * 0.5
+    pos += sum(1 for ch in lowered if ch in _POSITIVE_EMOJI) * 0.5
+    neg += sum(1 for ch in lowered if ch in _NEGATIVE_EMOJI) * 0.5
 
-    if re.search(r"\b(not|no|never)\s+(good|great|excellent|super|nice)\b", lowered):
+    if _NEGATED_POSITIVE_RE.search(lowered):
         neg += 1.0
-    if re.search(r"\b(not|no|never)\s+(bad|poor|waste|worst)\b", lowered):
+    if _NEGATED_NEGATIVE_RE.search(lowered):
         pos += 1.0
 
     delta = pos - neg
@@ -386,7 +553,7 @@ def heuristic_sentiment(text: str) -> Dict:
     elif delta < -0.35:
         sentiment = "negative"
     else:
-        if re.search(r"[a-zA-Z\u0900-\u0D7F]", lowered):
+        if _ANY_SCRIPT_LETTER_RE.search(lowered):
             sentiment = "neutral"
         else:
             sentiment = "unknown"
@@ -402,104 +569,191 @@ def heuristic_sentiment(text: str) -> Dict:
     }
 
 
-def parse_gemini_json(raw_text: str) -> Optional[Dict]:
+def parse_gemini_json(raw_text: str):
     if not raw_text:
         return None
     text = raw_text.strip()
     if text.startswith("```"):
-        text = re.sub(r"^```(?:json)?", "", text, flags=re.IGNORECASE).strip()
-        text = re.sub(r"```$", "", text).strip()
+        text = _JSON_FENCE_OPEN_RE.sub("", text).strip()
+        text = _JSON_FENCE_CLOSE_RE.sub("", text).strip()
 
     try:
-        return json.loads(text)
+        return json_loads(text)
     except Exception:
         pass
 
-    match = re.search(r"\{.*\}", text, re.DOTALL)
+    match = _JSON_ARRAY_RE.search(text) or _JSON_OBJECT_RE.search(text)
     if not match:
         return None
 
     try:
-        return json.loads(match.group(0))
+        return json_loads(match.group(0))
     except Exception:
         return None
 
 
-def analyze_with_gemini(text_input: str) -> Optional[Dict]:
-    model = get_gemini_model()
-    if model is None:
+def _gemini_result_from_parsed(parsed: Dict, text_input: str) -> Optional[Dict]:
+    sentiment = normalize_sentiment(str(parsed.get("sentiment", "")))
+    if sentiment == "unknown":
         return None
+    score = safe_float(parsed.get("score", DEFAULT_SENTIMENT_SCORE[sentiment]), DEFAULT_SENTIMENT_SCORE[sentiment])
+    language = normalize_language_name(str(parsed.get("language", "Unknown")))
+    summary = short_summary(normalize_whitespace(str(parsed.get("summary", text_input))))
+    return {
+        "sentiment": sentiment,
+        "sentiment_score": max(0.0, min(1.0, score)),
+        "lang": language,
+        "summary": summary,
+    }
+
 
-    prompt = f"""
+def analyze_with_gemini_batch(texts: List[str]) -> List[Optional[Dict]]:
+    results: List[Optional[Dict]] = [None] * len(texts)
+    model = get_gemini_model()
+    if model is None or not texts:
+        return results
+
+    for start in range(0, len(texts), GEMINI_BATCH_SIZE):
+        chunk = texts[start : start + GEMINI_BATCH_SIZE]
+        items = [{"id": index, "text": text} for index, text in enumerate(chunk)]
+        prompt = f"""
 You are an expert sentiment and language analyzer for Indian public comments.
-Analyze the text and return ONLY JSON in this exact schema:
-{{"sentiment":"POSITIVE|NEGATIVE|NEUTRAL|UNKNOWN","score":0.0-1.0,"language":"English/Hindi/Tamil/etc","summary":"one short summary"}}
+For each item in the input array, analyze its text and return ONLY a JSON array where
+every element has this exact schema:
+{{"id":<same id as input>,"sentiment":"POSITIVE|NEGATIVE|NEUTRAL|UNKNOWN","score":0.0-1.0,"language":"English/Hindi/Tamil/etc","summary":"one short summary"}}
 
-Text: {text_input}
+Input: {json.dumps(items, ensure_ascii=False)}
 """
+        try:
+            response = model.generate_content(prompt)
+            parsed = parse_gemini_json(getattr(response, "text", ""))
+        except Exception:
+            continue
 
-    try:
-        response = model.generate_content(prompt)
-        parsed = parse_gemini_json(getattr(response, "text", ""))
-        if not parsed:
-            return None
-        sentiment = normalize_sentiment(str(parsed.get("sentiment", "")))
-        if sentiment == "unknown":
-            return None
-        score = safe_float(parsed.get("score", DEFAULT_SENTIMENT_SCORE[sentiment]), DEFAULT_SENTIMENT_SCORE[sentiment])
-        language = normalize_language_name(str(parsed.get("language", "Unknown")))
-        summary = short_summary(str(parsed.get("summary", text_input)))
-        return {
-            "sentiment": sentiment,
-            "sentiment_score": max(0.0, min(1.0, score)),
-            "lang": language,
-            "summary": summary,
-        }
-    except Exception:
-        return None
+        if not isinstance(parsed, list):
+            continue
+
+        for entry in parsed:
+            if not isinstance(entry, dict):
+                continue
+            try:
+                index = int(entry.get("id", -1))
+            except Exception:
+                continue
+            if not 0 <= index < len(chunk):
+                continue
+            results[start + index] = _gemini_result_from_parsed(entry, chunk[index])
 
+    return results
 
-def analyze_comment(text: str) -> Dict:
-    cleaned = fix_mojibake(text)
-    if not cleaned:
-        return {
-            "sentiment": "unknown",
-            "sentiment_score": DEFAULT_SENTIMENT_SCORE["unknown"],
-            "lang": "Unknown",
-            "summary": "",
-        }
 
-    cache_key = text_hash(cleaned)
-    with _analysis_cache_lock:
-        cached = _analysis_cache.get(cache_key)
-    if cached:
-        return cached
-
-    local = heuristic_sentiment(cleaned)
-    result = {
-        "sentiment": local["sentiment"],
-        "sentiment_score": local["sentiment_score"],
-        "lang": detect_language_name(cleaned),
-        "summary": short_summary(cleaned),
+def analyze_with_gemini(text_input: str) -> Optional[Dict]:
+    return analyze_with_gemini_batch([text_input])[0]
+
+
+def analyze_comments_batch(texts: List[str]) -> List[Dict]:
+    """Analyze already-cleaned comment texts, batching Gemini calls.
+
+    Cached and empty texts are resolved locally; the remainder get a local
+    heuristic result and are sent to Gemini in one batched request per
+    GEMINI_BATCH_SIZE chunk instead of one HTTPS round trip per comment.
+    """
+    empty_result = {
+        "sentiment": "unknown",
+        "sentiment_score": DEFAULT_SENTIMENT_SCORE["unknown"],
+        "lang": "Unknown",
+        "summary": "",
     }
 
-    gemini = analyze_with_gemini(cleaned)
-    if gemini:
-        result = gemini
+    results: List[Optional[Dict]] = [None] * len(texts)
+    cache_keys: List[Optional[str]] = [None] * len(texts)
 
     with _analysis_cache_lock:
-        _analysis_cache[cache_key] = result
+        for index, cleaned in enumerate(texts):
+            if not cleaned:
+                results[index] = empty_result
+                continue
+            cache_keys[index] = text_hash(cleaned)
+            cached = _analysis_cache.get(cache_keys[index])
+            if cached:
+                results[index] = cached
+
+    missing = [index for index, result in enumerate(results) if result is None]
+    for index in missing:
+        local = heuristic_sentiment(texts[index])
+        results[index] = {
+            "sentiment": local["sentiment"],
+            "sentiment_score": local["sentiment_score"],
+            "lang": detect_language_name(texts[index]),
+            "summary": short_summary(texts[index]),
+        }
+
+    gemini_results = analyze_with_gemini_batch([texts[index] for index in missing])
+    for index, gemini in zip(missing, gemini_results):
+        if gemini:
+            results[index] = gemini
 
-    return result
+    with _analysis_cache_lock:
+        for index in missing:
+            _analysis_cache[cache_keys[index]] = results[index]
 
+    return results
 
-def extract_comments_from_html(fragment_html: str) -> List[Dict]:
-    soup = BeautifulSoup(fragment_html or "", "html.parser")
+
+def analyze_comment(text: str) -> Dict:
+    return analyze_comments_batch([fix_mojibake(text)])[0]
+
+
+def _extract_comments_lxml(fragment_html: str) -> List[Dict]:
+    try:
+        tree = lxml_html.fromstring(fragment_html)
+    except Exception:
+        return []
+
+    rows: List[Dict] = []
+
+    for article in _SEL_ARTICLE(tree):
+        text_el = next(iter(_SEL_BODY(article)), None)
+        if text_el is None:
+            continue
+
+        text = fix_mojibake(_NODE_TEXT_XPATH(text_el))
+        if is_junk_or_boilerplate(text):
+            continue
+
+        author_el = next(iter(_SEL_USER(article)), None)
+        author = fix_mojibake(_NODE_TEXT_XPATH(author_el) if author_el is not None else "Unknown")
+        if is_placeholder_author(author):
+            author = "Unknown"
+
+        ts_el = next(iter(_SEL_TIME(article)), None)
+        timestamp = fix_mojibake(_NODE_TEXT_XPATH(ts_el) if ts_el is not None else "")
+
+        rows.append({"author": author or "Unknown", "timestamp": timestamp, "text": text})
+
+    if rows:
+        return rows
+
+    for node in _SEL_BODY(tree):
+        text = fix_mojibake(_NODE_TEXT_XPATH(node))
+        if is_junk_or_boilerplate(text):
+            continue
+        preceding = _PRECEDING_USERNAME_XPATH(node)
+        author = fix_mojibake(_NODE_TEXT_XPATH(preceding[-1]) if preceding else "Unknown")
+        if is_placeholder_author(author):
+            author = "Unknown"
+        rows.append({"author": author or "Unknown", "timestamp": "", "text": text})
+
+    return rows
+
+
+def _extract_comments_bs4(fragment_html: str) -> List[Dict]:
+    soup = BeautifulSoup(fragment_html, "html.parser")
     rows: List[Dict] = []
 
-    articles = soup.select("article.comment_row, article.comment")
+    articles = soup.select(COMMENT_ARTICLE_SELECTOR)
     for article in articles:
-        text_el = article.select_one("div.comment_body")
+        text_el = article.select_one(COMMENT_BODY_SELECTOR)
         if text_el is None:
             continue
 
@@ -507,12 +761,12 @@ def extract_comments_from_html(fragment_html: str) -> List[Dict]:
         if is_junk_or_boilerplate(text):
             continue
 
-        author_el = article.select_one("span.username, .username, .comment_user, .user-name")
+        author_el = article.select_one(COMMENT_USER_SELECTOR)
         author = fix_mojibake(author_el.get_text(" ", strip=True) if author_el else "Unknown")
         if is_placeholder_author(author):
             author = "Unknown"
 
-        ts_el = article.select_one("time, span.timeago, .submitted, .comment_date, .comment-time")
+        ts_el = article.select_one(COMMENT_TIME_SELECTOR)
         timestamp = fix_mojibake(ts_el.get_text(" ", strip=True) if ts_el else "")
 
         rows.append({"author": author or "Unknown", "timestamp": timestamp, "text": text})
@@ -520,7 +774,7 @@ def extract_comments_from_html(fragment_html: str) -> List[Dict]:
     if rows:
         return rows
 
-    fallback_nodes = soup.select("div.comment_body")
+    fallback_nodes = soup.select(COMMENT_BODY_SELECTOR)
     for node in fallback_nodes:
         text = fix_mojibake(node.get_text(" ", strip=True))
         if is_junk_or_boilerplate(text):
@@ -534,18 +788,43 @@ def extract_comments_from_html(fragment_html: str) -> List[Dict]:
     return rows
 
 
+def extract_comments_from_html(fragment_html: str) -> List[Dict]:
+    if not fragment_html:
+        return []
+    if lxml_html is not None:
+        return _extract_comments_lxml(fragment_html)
+    return _extract_comments_bs4(fragment_html)
+
+
+def read_response_capped(response) -> bytes:
+    """Read a streamed response body, refusing anything over MAX_RESPONSE_BYTES."""
+    declared = response.headers.get("Content-Length", "")
+    if declared.isdigit() and int(declared) > MAX_RESPONSE_BYTES:
+        raise RuntimeError(f"Response body exceeds {MAX_RESPONSE_BYTES} byte cap.")
+
+    chunks = []
+    total = 0
+    for chunk in response.iter_content(chunk_size=65536):
+        total += len(chunk)
+        if total > MAX_RESPONSE_BYTES:
+            raise RuntimeError(f"Response body exceeds {MAX_RESPONSE_BYTES} byte cap.")
+        chunks.append(chunk)
+    return b"".join(chunks)
+
+
 def fetch_html(url: str) -> str:
-    response = requests.get(url, headers=REQUEST_HEADERS, timeout=REQUEST_TIMEOUT_SECONDS)
-    response.raise_for_status()
-    return response.text
+    with _HTTP.get(url, stream=True, timeout=REQUEST_TIMEOUT_SECONDS) as response:
+        response.raise_for_status()
+        body = read_response_capped(response)
+        return body.decode(response.encoding or "utf-8", errors="replace")
 
 
 def extract_view_params(page_html: str) -> Dict[str, str]:
-    match = re.search(r"jQuery\.extend\(Drupal\.settings,\s*(\{.*?\})\s*\);", page_html, re.DOTALL)
+    match = _DRUPAL_SETTINGS_RE.search(page_html)
     if not match:
         raise RuntimeError("Could not find Drupal settings JSON in source page.")
 
-    settings = json.loads(match.group(1))
+    settings = json_loads(match.group(1))
     ajax_views = (settings.get("views") or {}).get("ajaxViews") or {}
     if not ajax_views:
         raise RuntimeError("Could not find ajax view configuration for comments.")
@@ -578,66 +857,123 @@ def fetch_ajax_page(source_url: str, view_params: Dict[str, str], page_token: st
     params["_drupal_ajax"] = "1"
     params["page"] = page_token
 
-    headers = dict(REQUEST_HEADERS)
-    headers["X-Requested-With"] = "XMLHttpRequest"
-    headers["Referer"] = source_url
-
     ajax_url = urljoin(source_url, "/views/ajax/")
-    response = requests.get(ajax_url, params=params, headers=headers, timeout=REQUEST_TIMEOUT_SECONDS)
-    response.raise_for_status()
+    with _HTTP.get(
+        ajax_url,
+        params=params,
+        headers={"X-Requested-With": "XMLHttpRequest", "Referer": source_url},
+        stream=True,
+        timeout=REQUEST_TIMEOUT_SECONDS,
+    ) as response:
+        response.raise_for_status()
+        body = read_response_capped(response)
 
-    payload = response.json()
+    try:
+        payload = json_loads(body)
+    except Exception:
+        return ""
     if not isinstance(payload, list):
         return ""
 
-    for item in payload:
-        if item.get("command") == "insert" and isinstance(item.get("data"), str):
-            return item["data"]
+    # Only the first insert command's HTML matters; stop scanning at the
+    # match instead of touching every Drupal command in the payload.
+    return next(
+        (
+            item["data"]
+            for item in payload
+            if isinstance(item, dict)
+            and item.get("command") == "insert"
+            and isinstance(item.get("data"), str)
+        ),
+        "",
+    )
 
-    return ""
 
+def make_comment_key(author: str, text: str) -> tuple:
+    # A (str, str) tuple hashes natively in ~100ns; the keys never leave the
+    # process, so a stable digest buys nothing here.
+    return (normalize_whitespace(author).lower(), normalize_whitespace(text).lower())
 
-def make_comment_key(author: str, text: str) -> str:
-    return text_hash(f"{normalize_whitespace(author).lower()}|{normalize_whitespace(text).lower()}")
 
+def fetch_page_rows(source_url: str, view_params: Dict[str, str], page_index: int) -> List[Dict]:
+    tokens = ["0"] if page_index == 0 else [f"0,{page_index}", str(page_index)]
+    for token in tokens:
+        fragment = fetch_ajax_page(source_url, view_params, token)
+        extracted = extract_comments_from_html(fragment)
+        if extracted:
+            return extracted
+    return []
+
+
+def get_view_params(source_url: str, force_refresh: bool = False):
+    """Return (view_params, from_cache) for a source page.
+
+    The Drupal ajax view parameters are stable for the lifetime of a mygov
+    issue, so caching them skips one full-page fetch and parse per refresh.
+    """
+    now = time.monotonic()
+    if not force_refresh:
+        with _view_params_cache_lock:
+            entry = _view_params_cache.get(source_url)
+        if entry and now - entry[0] < VIEW_PARAMS_TTL_SECONDS:
+            return entry[1], True
 
-def scrape_comments_paginated(source_url: str) -> List[Dict]:
     page_html = fetch_html(source_url)
-    view_params = extract_view_params(page_html)
+    params = extract_view_params(page_html)
+    with _view_params_cache_lock:
+        _view_params_cache[source_url] = (now, params)
+    return params, False
+
+
+def scrape_comments_paginated(source_url: str) -> List[Dict]:
+    view_params, from_cache = get_view_params(source_url)
+    collected = _scrape_comment_pages(source_url, view_params)
+
+    if not collected and from_cache:
+        # Cached params may have expired server-side; refetch once.
+        view_params, _ = get_view_params(source_url, force_refresh=True)
+        collected = _scrape_comment_pages(source_url, view_params)
+
+    return collected
 
+
+def _scrape_comment_pages(source_url: str, view_params: Dict[str, str]) -> List[Dict]:
     collected: List[Dict] = []
     seen_keys = set()
-    empty_streak = 0
 
-    for page_index in range(MAX_PAGES_PER_SCRAPE):
-        tokens = ["0"] if page_index == 0 else [f"0,{page_index}", str(page_index)]
-        page_rows: List[Dict] = []
+    # Pages are fetched in parallel batches; the shared session's connection
+    # pool absorbs the concurrency. Dedup stays in this thread so seen_keys
+    # needs no locking, and pages are consumed in index order to keep the
+    # collected list stable.
+    with ThreadPoolExecutor(max_workers=SCRAPE_CONCURRENCY) as executor:
+        for batch_start in range(0, MAX_PAGES_PER_SCRAPE, SCRAPE_CONCURRENCY):
+            batch_indices = range(
+                batch_start, min(batch_start + SCRAPE_CONCURRENCY, MAX_PAGES_PER_SCRAPE)
+            )
+            futures = {
+                page_index: executor.submit(fetch_page_rows, source_url, view_params, page_index)
+                for page_index in batch_indices
+            }
 
-        for token in tokens:
-            fragment = fetch_ajax_page(source_url, view_params, token)
-            extracted = extract_comments_from_html(fragment)
-            if extracted:
-                page_rows = extracted
+            new_in_batch = 0
+            for page_index in batch_indices:
+                try:
+                    page_rows = futures[page_index].result()
+                except Exception:
+                    page_rows = []
+
+                for row in page_rows:
+                    key = make_comment_key(row.get("author", ""), row.get("text", ""))
+                    if key in seen_keys:
+                        continue
+                    seen_keys.add(key)
+                    collected.append(row)
+                    new_in_batch += 1
+
+            if batch_start > 0 and new_in_batch == 0:
                 break
-
-        if not page_rows:
-            empty_streak += 1
-            if page_index > 0 and empty_streak >= 2:
+            if batch_start == 0 and new_in_batch == 0 and not collected:
                 break
-            continue
-
-        empty_streak = 0
-        new_in_page = 0
-        for row in page_rows:
-            key = make_comment_key(row.get("author", ""), row.get("text", ""))
-            if key in seen_keys:
-                continue
-            seen_keys.add(key)
-            collected.append(row)
-            new_in_page += 1
-
-        if page_index > 0 and new_in_page == 0:
-            break
 
     return collected
 
@@ -656,40 +992,54 @@ def normalize_rows(rows: List[Dict]) -> List[Dict]:
 
         timestamp = fix_mojibake(row.get("timestamp", ""))
 
-        analysis = analyze_comment(text)
+        normalized.append({"author": author, "timestamp": timestamp, "text": text})
 
-        normalized.append(
-            {
-                "author": author,
-                "timestamp": timestamp,
-                "text": text,
-                "lang": normalize_language_name(analysis.get("lang", "Unknown")) or "Unknown",
-                "sentiment": normalize_sentiment(analysis.get("sentiment", "unknown")),
-                "sentiment_score": safe_float(analysis.get("sentiment_score", 0.0), 0.0),
-                "summary": short_summary(analysis.get("summary", text)),
-            }
-        )
+    analyses = analyze_comments_batch([row["text"] for row in normalized])
+
+    for row, analysis in zip(normalized, analyses):
+        row["lang"] = normalize_language_name(analysis.get("lang", "Unknown")) or "Unknown"
+        row["sentiment"] = normalize_sentiment(analysis.get("sentiment", "unknown"))
+        row["sentiment_score"] = safe_float(analysis.get("sentiment_score", 0.0), 0.0)
+        row["summary"] = analysis.get("summary") or short_summary(row["text"])
 
     return normalized
 
 
 def save_rows_to_csv(rows: List[Dict], path: Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    with path.open("w", newline="", encoding="utf-8-sig") as file:
-        writer = csv.DictWriter(file, fieldnames=CSV_FIELDS)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(
-                {
-                    "author": row.get("author", "Unknown"),
-                    "timestamp": row.get("timestamp", ""),
-                    "text": row.get("text", ""),
-                    "lang": row.get("lang", "Unknown"),
-                    "sentiment": normalize_sentiment(row.get("sentiment", "unknown")),
-                    "sentiment_score": f"{safe_float(row.get('sentiment_score', 0.0), 0.0):.4f}",
-                    "summary": row.get("summary", ""),
-                }
-            )
+
+    rows_out = [
+        [
+            row.get("author", "Unknown"),
+            row.get("timestamp", ""),
+            row.get("text", ""),
+            row.get("lang", "Unknown"),
+            row.get("sentiment", "unknown"),
+            f"{safe_float(row.get('sentiment_score', 0.0), 0.0):.4f}",
+            row.get("summary", ""),
+        ]
+        for row in rows
+    ]
+
+    # Write to a sibling temp file and rename so /api/live-comments never
+    # observes a partially written CSV.
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    with tmp_path.open("w", newline="", encoding="utf-8-sig") as file:
+        writer = csv.writer(file)
+        writer.writerow(CSV_FIELDS)
+        writer.writerows(rows_out)
+    os.replace(tmp_path, path)
+
+
+def mirror_csv(src: Path, dst: Path) -> None:
+    """Mirror src to dst via hard link, copying when linking is unsupported."""
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    try:
+        if dst.exists():
+            dst.unlink()
+        os.link(src, dst)
+    except OSError:
+        shutil.copyfile(src, dst)
 
 
 def load_rows_from_csv(path: Path) -> List[Dict]:
@@ -722,6 +1072,31 @@ def load_rows_from_csv(path: Path) -> List[Dict]:
     return []
 
 
+def load_existing_rows(path: Path) -> List[Dict]:
+    """Load previously analyzed rows, trusting their stored analysis fields.
+
+    Unlike normalize_rows this never re-runs sentiment/language analysis, so
+    refresh cycles pay for new comments only.
+    """
+    rows: List[Dict] = []
+    for row in load_rows_from_csv(path):
+        text = fix_mojibake(row.get("text", ""))
+        if is_junk_or_boilerplate(text):
+            continue
+        rows.append(
+            {
+                "author": fix_mojibake(row.get("author", "Unknown")) or "Unknown",
+                "timestamp": fix_mojibake(row.get("timestamp", "")),
+                "text": text,
+                "lang": row.get("lang", "Unknown") or "Unknown",
+                "sentiment": normalize_sentiment(row.get("sentiment", "unknown")),
+                "sentiment_score": safe_float(row.get("sentiment_score", 0.0), 0.0),
+                "summary": row.get("summary") or text,
+            }
+        )
+    return rows
+
+
 def merge_with_existing(new_rows: List[Dict], existing_rows: List[Dict]) -> List[Dict]:
     merged: List[Dict] = []
     seen = set()
@@ -742,31 +1117,27 @@ def scrape_and_analyze_source(source_id: str) -> List[Dict]:
     if not scraped_rows:
         raise RuntimeError("No comments extracted from source.")
 
-    analyzed_rows = normalize_rows(scraped_rows)
-    if not analyzed_rows:
+    existing_rows = load_existing_rows(csv_path(source_id))
+    existing_keys = {make_comment_key(row["author"], row["text"]) for row in existing_rows}
+
+    fresh_rows = [
+        row
+        for row in scraped_rows
+        if make_comment_key(row.get("author", ""), row.get("text", "")) not in existing_keys
+    ]
+    analyzed_rows = normalize_rows(fresh_rows)
+    if not analyzed_rows and not existing_rows:
         raise RuntimeError("No valid comments after analysis.")
 
-    existing_rows = normalize_rows(load_rows_from_csv(csv_path(source_id)))
     merged_rows = merge_with_existing(analyzed_rows, existing_rows)
 
+    # Raw and processed files share the same schema, so merged_rows serves
+    # both; the dashboard copies are hard links to avoid re-serializing.
     save_rows_to_csv(merged_rows, csv_path(source_id))
-    save_rows_to_csv(merged_rows, dashboard_csv_path(source_id))
+    mirror_csv(csv_path(source_id), dashboard_csv_path(source_id))
 
-    raw_like_rows = [
-        {
-            "author": row.get("author", "Unknown"),
-            "timestamp": row.get("timestamp", ""),
-            "text": row.get("text", ""),
-            "lang": row.get("lang", "Unknown"),
-            "sentiment": row.get("sentiment", "unknown"),
-            "sentiment_score": row.get("sentiment_score", 0.0),
-            "summary": row.get("summary", row.get("text", "")),
-        }
-        for row in merged_rows
-    ]
-
-    save_rows_to_csv(raw_like_rows, raw_csv_path(source_id))
-    save_rows_to_csv(raw_like_rows, dashboard_raw_csv_path(source_id))
+    save_rows_to_csv(merged_rows, raw_csv_path(source_id))
+    mirror_csv(raw_csv_path(source_id), dashboard_raw_csv_path(source_id))
 
     return merged_rows
 
@@ -782,6 +1153,8 @@ def refresh_site_state(source_id: str) -> None:
     try:
         merged_rows = scrape_and_analyze_source(source_id)
         with _state_lock:
+            # Invariant: assign a new list, never mutate the published one —
+            # state_payload hands out the same reference without copying.
             _site_states[source_id]["comments"] = merged_rows
             _site_states[source_id]["last_updated"] = datetime.now(timezone.utc).isoformat()
             _site_states[source_id]["last_error"] = None
@@ -792,16 +1165,19 @@ def refresh_site_state(source_id: str) -> None:
         with _state_lock:
             _site_states[source_id]["in_progress"] = False
 
+    # Re-serialize once per refresh so pollers get cache hits immediately.
+    serialized_state_payload(source_id)
+
 
 def ensure_seed_data() -> None:
     for source_id in SITE_CONFIG:
-        processed = normalize_rows(load_rows_from_csv(csv_path(source_id)))
+        processed = load_existing_rows(csv_path(source_id))
         if not processed:
-            processed = normalize_rows(load_rows_from_csv(dashboard_csv_path(source_id)))
+            processed = load_existing_rows(dashboard_csv_path(source_id))
         if not processed:
-            processed = normalize_rows(load_rows_from_csv(raw_csv_path(source_id)))
+            processed = load_existing_rows(raw_csv_path(source_id))
         if not processed:
-            processed = normalize_rows(load_rows_from_csv(dashboard_raw_csv_path(source_id)))
+            processed = load_existing_rows(dashboard_raw_csv_path(source_id))
 
         with _state_lock:
             _site_states[source_id]["comments"] = processed
@@ -838,13 +1214,42 @@ def trigger_refresh_if_needed(source_id: str, force: bool = False) -> bool:
         return True
 
 
+# Serialized /api/live-comments bodies, keyed by source_id and tagged with
+# the state signature they were built from; dashboards polling every few
+# seconds reuse the same bytes until a refresh changes the state.
+_payload_cache: Dict[str, tuple] = {}
+_payload_cache_lock = threading.Lock()
+
+
+def _state_signature(source_id: str) -> tuple:
+    with _state_lock:
+        state = _site_states[source_id]
+        return (state["last_updated"], state["in_progress"], state["last_error"])
+
+
+def serialized_state_payload(source_id: str) -> bytes:
+    signature = _state_signature(source_id)
+
+    with _payload_cache_lock:
+        cached = _payload_cache.get(source_id)
+    if cached and cached[0] == signature:
+        return cached[1]
+
+    body = json_dumps_bytes(state_payload(source_id))
+    with _payload_cache_lock:
+        _payload_cache[source_id] = (signature, body)
+    return body
+
+
 def state_payload(source_id: str) -> Dict:
     with _state_lock:
         state = _site_states[source_id]
         return {
             "source_id": source_id,
             "source_name": state["source_name"],
-            "comments": list(state["comments"]),
+            # Safe to share without copying: refresh_site_state always
+            # replaces the comments list wholesale, never mutates it.
+            "comments": state["comments"],
             "last_updated": state["last_updated"],
             "in_progress": state["in_progress"],
             "last_error": state["last_error"],
@@ -856,25 +1261,25 @@ def state_payload(source_id: str) -> Dict:
 def get_live_comments():
     source_id = request.args.get("source", "site1")
     if source_id not in SITE_CONFIG:
-        return jsonify({"error": f"Unknown source: {source_id}"}), 400
+        return json_response({"error": f"Unknown source: {source_id}"}), 400
 
     trigger_refresh_if_needed(source_id)
-    return jsonify(state_payload(source_id))
+    return app.response_class(serialized_state_payload(source_id), mimetype="application/json")
 
 
 @app.route("/api/refresh-now", methods=["GET", "POST"])
 def refresh_now():
     source_id = request.args.get("source", "site1")
     if source_id not in SITE_CONFIG:
-        return jsonify({"error": f"Unknown source: {source_id}"}), 400
+        return json_response({"error": f"Unknown source: {source_id}"}), 400
 
     started = trigger_refresh_if_needed(source_id, force=True)
-    return jsonify({"ok": True, "started": started, "source": source_id})
+    return json_response({"ok": True, "started": started, "source": source_id})
 
 
 @app.route("/api/sources", methods=["GET"])
 def get_sources():
-    return jsonify(
+    return json_response(
         {
             "sources": [
                 {"id": source_id, "name": conf["name"], "url": conf["url"]}
@@ -889,7 +1294,7 @@ def get_sources():
 
 @app.route("/api/health", methods=["GET"])
 def health():
-    return jsonify({"ok": True, "service": "mygov-dashboard-backend"})
+    return json_response({"ok": True, "service": "mygov-dashboard-backend"})
 
 
 if __name__ == "__main__":
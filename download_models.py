@@ -14,17 +14,32 @@ SUMM_MODEL_ID = "csebuetnlp/mT5_multilingual_XLSum"
 print("--- Starting Model Download Process ---")
 print("This is a one-time setup and may take a while depending on your internet connection.")
 
+# Prefer the safetensors weight files (mmap-loaded, no pickle) and stream
+# weights straight into place instead of materializing an extra fp32 copy.
+MODEL_LOAD_KWARGS = dict(cache_dir=CACHE_DIR, low_cpu_mem_usage=True, use_safetensors=True)
+
+
+def download_model(auto_class, model_id):
+    """Downloads a model, falling back to the default loader if the optimized
+    kwargs fail (accelerate missing, or no safetensors files published)."""
+    try:
+        auto_class.from_pretrained(model_id, **MODEL_LOAD_KWARGS)
+    except Exception as e:
+        print(f"⚠️ Optimized download failed ({e}); retrying with default settings.")
+        auto_class.from_pretrained(model_id, cache_dir=CACHE_DIR)
+
+
 try:
     print(f"📥 Downloading sentiment model: {SENT_MODEL_ID}...")
     # Download all necessary files for the sentiment model.
     AutoTokenizer.from_pretrained(SENT_MODEL_ID, cache_dir=CACHE_DIR)
-    AutoModelForSequenceClassification.from_pretrained(SENT_MODEL_ID, cache_dir=CACHE_DIR)
+    download_model(AutoModelForSequenceClassification, SENT_MODEL_ID)
     print("✅ Sentiment model downloaded successfully.")
 
     print(f"📥 Downloading summarization model: {SUMM_MODEL_ID}...")
     # Download all necessary files for the summarization model.
     AutoTokenizer.from_pretrained(SUMM_MODEL_ID, cache_dir=CACHE_DIR)
-    AutoModelForSeq2SeqLM.from_pretrained(SUMM_MODEL_ID, cache_dir=CACHE_DIR)
+    download_model(AutoModelForSeq2SeqLM, SUMM_MODEL_ID)
     print("✅ Summarization model downloaded successfully.")
 
 except Exception as e:
@@ -1,8 +1,9 @@
 import os
 import shutil
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
-from scrape_mygov_comments import main
+from scrape_mygov_comments import main, scrape_comments_selenium
 
 # This path correctly places the output files where the React dashboard can access them.
 OUTPUT_DIR = os.path.join("dashboard", "public", "outputs")
@@ -12,6 +13,10 @@ os.makedirs(OUTPUT_DIR, exist_ok=True)
 SITE1 = "https://www.mygov.in/group-issue/inviting-ideas-mann-ki-baat-prime-minister-narendra-modi-28th-september-2025/"
 SITE2 = "https://www.mygov.in/group-issue/inviting-comments-draft-indian-language-standard-akshar-hindi-language/"
 
+# Scraping is network/render-bound, so the sites are fetched in parallel;
+# each worker thread drives its own headless Chrome instance.
+SCRAPE_WORKERS = int(os.environ.get("SCRAPE_WORKERS", "4"))
+
 
 def safe_replace(src_filename, dst_filename):
     """Safely copies the processed file to dashboard/public and outputs/ (site-specific)."""
@@ -25,20 +30,39 @@ def safe_replace(src_filename, dst_filename):
             return
 
         shutil.copy2(src_path, dashboard_dst_path)
-        shutil.copy2(src_path, archive_dst_path)
+        # The archive copy is identical, so hardlink it to the dashboard copy
+        # instead of reading/writing the bytes a second time. Fall back to a
+        # real copy where hardlinks are unsupported (e.g. Windows, or the two
+        # paths live on different filesystems).
+        if os.path.exists(archive_dst_path):
+            os.remove(archive_dst_path)
+        try:
+            os.link(dashboard_dst_path, archive_dst_path)
+        except OSError:
+            shutil.copy2(src_path, archive_dst_path)
     except Exception as e:
         print(f"Error: Failed to copy file {src_path}: {e}", file=sys.stderr)
 
 
 if __name__ == "__main__":
-    # --- Scrape Site 1 ---
-    print(">>> Scraping Mann Ki Baat (Site 1)...")
-    main(SITE1)
-    safe_replace("comments_processed.csv", "comments_processed_site1.csv")
-
-    # --- Scrape Site 2 ---
-    print("\n>>> Scraping Akshar Hindi (Site 2)...")
-    main(SITE2)
-    safe_replace("comments_processed.csv", "comments_processed_site2.csv")
+    # Pipeline the two sites: scraping is I/O-bound on the browser while the
+    # NLP stage is compute-bound, so Site 1's analysis runs while Site 2 is
+    # still scraping in the background. The models stay single-user.
+    print(">>> Scraping both sites in parallel...")
+    with ThreadPoolExecutor(max_workers=min(SCRAPE_WORKERS, 2)) as executor:
+        future1 = executor.submit(scrape_comments_selenium, SITE1)
+        future2 = executor.submit(scrape_comments_selenium, SITE2)
+
+        # --- Analyze Site 1 (while Site 2 scrapes) ---
+        comments1 = future1.result()
+        print("\n>>> Analyzing Mann Ki Baat (Site 1)...")
+        main(SITE1, comments=comments1)
+        safe_replace("comments_processed.csv", "comments_processed_site1.csv")
+
+        # --- Analyze Site 2 ---
+        comments2 = future2.result()
+        print("\n>>> Analyzing Akshar Hindi (Site 2)...")
+        main(SITE2, comments=comments2)
+        safe_replace("comments_processed.csv", "comments_processed_site2.csv")
 
     print(f"\nScraping complete. All files are saved in: {os.path.abspath(OUTPUT_DIR)}")
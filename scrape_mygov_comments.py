@@ -1,14 +1,33 @@
+import csv
+import hashlib
+import json
 import os
+import pickle
 import re
 import time
-import pandas as pd
 import requests
 from bs4 import BeautifulSoup
+import soupsieve as sv
 from langdetect import detect, DetectorFactory, LangDetectException
-from transformers import pipeline, AutoModelForSeq2SeqLM, AutoTokenizer
+import torch
+from transformers import pipeline, AutoModelForSeq2SeqLM, AutoModelForSequenceClassification, AutoTokenizer
 import pycountry
 from tqdm import tqdm
 
+# Optional fast language detector (C++ core); langdetect stays as fallback.
+try:
+    import fasttext
+except Exception:
+    fasttext = None
+
+# lxml parses the tens-of-thousands-of-lines MyGov page source several
+# times faster than the pure-Python html.parser; same BS4 API either way.
+try:
+    import lxml  # noqa: F401
+    BS4_PARSER = "lxml"
+except Exception:
+    BS4_PARSER = "html.parser"
+
 # Selenium for dynamic content
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options as ChromeOptions
@@ -26,15 +45,157 @@ from webdriver_manager.chrome import ChromeDriverManager
 from selenium.webdriver.chrome.service import Service
 
 # --- SETUP ---
+# langdetect normally loads all 55 language profiles (~75 MB resident);
+# restricting it to the languages MyGov comments can realistically contain
+# cuts memory roughly in half and speeds up detect(), whose scoring is
+# proportional to the number of loaded profiles.
+LANGDETECT_LANGUAGES = [
+    "en", "hi", "bn", "ta", "te", "mr", "gu", "kn", "ml", "pa", "ur", "ne",
+    "es", "fr", "de",
+]
+
+
+def _subset_langdetect_profiles():
+    import langdetect.detector_factory as ldf
+    from langdetect.utils.lang_profile import LangProfile
+
+    wanted = set(LANGDETECT_LANGUAGES)
+
+    def init_factory_subset():
+        if ldf._factory is None:
+            ldf._factory = ldf.DetectorFactory()
+            ldf._factory.seed = DetectorFactory.seed
+            names = sorted(n for n in os.listdir(ldf.PROFILES_DIRECTORY) if n in wanted)
+            for index, name in enumerate(names):
+                with open(os.path.join(ldf.PROFILES_DIRECTORY, name), "r", encoding="utf-8") as fh:
+                    ldf._factory.add_profile(LangProfile(**json.load(fh)), index, len(names))
+
+    ldf.init_factory = init_factory_subset
+
+
+try:
+    _subset_langdetect_profiles()
+except Exception as e:
+    print(f"Warning: could not subset langdetect profiles ({e}); using the full set.")
+
 DetectorFactory.seed = 0
 os.makedirs("outputs", exist_ok=True)
 CACHE_DIR = "models_cache"
 os.makedirs(CACHE_DIR, exist_ok=True)
 
+# Let the Rust-backed tokenizers use all cores; must be set before the
+# tokenizers are first used.
+os.environ.setdefault("TOKENIZERS_PARALLELISM", "true")
+
+# Keep webdriver_manager offline-friendly and quiet; the resolved driver
+# path is additionally cached on disk (see _resolve_chromedriver_path).
+os.environ.setdefault("WDM_LOCAL", "1")
+os.environ.setdefault("WDM_LOG_LEVEL", "0")
+
 # --- AI MODELS ---
 SENT_MODEL_ID = "cardiffnlp/twitter-xlm-roberta-base-sentiment-multilingual"
 SUMM_MODEL_ID = "csebuetnlp/mT5_multilingual_XLSum"
 
+# GPU with fp16 roughly halves memory traffic and doubles throughput on
+# tensor cores; fall back to fp32 on CPU where half precision is slower.
+DEVICE = 0 if torch.cuda.is_available() else -1
+TORCH_DTYPE = torch.float16 if torch.cuda.is_available() else torch.float32
+
+# This process only ever runs inference; turning autograd off globally
+# spares the bookkeeping and activation storage on every forward pass.
+torch.set_grad_enabled(False)
+
+# safetensors weights are mmap-loaded (no pickle pass) and meta-device
+# loading avoids materializing a throwaway fp32 copy — together roughly
+# halving peak RAM while the ~2.3 GB mT5 checkpoint loads.
+MODEL_LOAD_KWARGS = dict(low_cpu_mem_usage=True, use_safetensors=True)
+
+# --- RESULT CACHES ---
+# MyGov comments repeat heavily (templated slogans, copy-pasted replies), so
+# a content-keyed cache turns most transformer calls into dict lookups. The
+# cache is persisted under outputs/ so re-scrapes across runs also hit.
+SENTIMENT_CACHE_PATH = os.path.join("outputs", ".sentiment_cache.pkl")
+SENTIMENT_CACHE = {}   # blake2b(text) -> (label, score)
+LANG_CACHE = {}        # text[:256] -> language code (langdetect is seeded)
+
+
+def _cache_key(text):
+    return hashlib.blake2b(text.encode("utf-8", "ignore"), digest_size=16).digest()
+
+
+# Strips punctuation, symbols and emoji; combined with lowercasing and
+# whitespace collapsing this folds near-duplicates ("Jai Hind!", "jai hind")
+# into one cluster key.
+_NON_WORD_RE = re.compile(r"[^\w\s]", re.UNICODE)
+
+
+def _near_dup_key(text):
+    normalized = _NON_WORD_RE.sub(" ", text.lower())
+    normalized = " ".join(normalized.split())
+    return hashlib.blake2b(normalized.encode("utf-8", "ignore"), digest_size=8).digest()
+
+
+def load_result_caches():
+    global SENTIMENT_CACHE, LANG_CACHE
+    try:
+        with open(SENTIMENT_CACHE_PATH, "rb") as f:
+            data = pickle.load(f)
+        SENTIMENT_CACHE = data.get("sentiment", {})
+        LANG_CACHE = data.get("lang", {})
+    except Exception:
+        SENTIMENT_CACHE, LANG_CACHE = {}, {}
+
+
+def save_result_caches():
+    try:
+        with open(SENTIMENT_CACHE_PATH, "wb") as f:
+            pickle.dump({"sentiment": SENTIMENT_CACHE, "lang": LANG_CACHE}, f)
+    except Exception as e:
+        print(f"Warning: failed to persist sentiment cache: {e}")
+
+
+load_result_caches()
+
+# --- LANGUAGE DETECTION ---
+FASTTEXT_MODEL_PATH = os.environ.get(
+    "FASTTEXT_LID_MODEL",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "lid.176.ftz"),
+)
+_fasttext_model = None
+_fasttext_failed = fasttext is None
+
+
+def get_fasttext_model():
+    """Lazily loads the fastText lid.176 model; returns None when unavailable."""
+    global _fasttext_model, _fasttext_failed
+    if _fasttext_failed:
+        return None
+    if _fasttext_model is None:
+        try:
+            _fasttext_model = fasttext.load_model(FASTTEXT_MODEL_PATH)
+        except Exception:
+            _fasttext_failed = True
+            return None
+    return _fasttext_model
+
+
+def detect_language_code(text):
+    """Detects an ISO language code, preferring fastText over langdetect."""
+    model = get_fasttext_model()
+    if model is not None:
+        try:
+            labels, _ = model.predict(text.replace("\n", " "), k=1)
+            return labels[0].replace("__label__", "")
+        except Exception:
+            pass
+    try:
+        return detect(text)
+    except LangDetectException:
+        return "unknown"
+    except Exception:
+        return "unknown"
+
+
 # --- HELPER FUNCTIONS ---
 def get_language_full_name(code: str) -> str:
     """Converts a 2-letter language code to its full name."""
@@ -46,34 +207,232 @@ def get_language_full_name(code: str) -> str:
     except Exception:
         return code.upper()
 
+# Hoisted patterns for the per-comment hot path; compiling once avoids even
+# the re module's cache lookup on every call.
+_JUNK_RE = re.compile(r"Like\s*\(\d+\)\s*Dislike\s*\(\d+\).*", re.IGNORECASE)
+_WS_RE = re.compile(r"\s+")
+
+
 def is_junk_or_boilerplate(text: str) -> bool:
     """Filters out very short or irrelevant text."""
-    if not text or len(text.split()) < 3:
+    # Fewer than 2 spaces means fewer than 3 words; cheaper than split().
+    if not text or text.count(" ") < 2:
         return True
-    if re.fullmatch(r"Like\s*\(\d+\)\s*Dislike\s*\(\d+\).*", text, re.IGNORECASE):
+    if _JUNK_RE.fullmatch(text):
         return True
     return False
 
 # --- NLP PIPELINE SETUP ---
+SENTIMENT_BATCH_SIZE = 32
+SUMMARY_BATCH_SIZE = 8
+# Summarizing slogans wastes a full mT5 forward pass, and mT5 attention is
+# quadratic in input length, so short comments are skipped and long ones
+# truncated.
+SUMMARY_MIN_WORDS = 40
+SUMMARY_MAX_INPUT_TOKENS = 512
+
+
+def _load_fast_tokenizer(model_id):
+    """Loads the Rust-backed fast tokenizer for model_id.
+
+    Fast tokenizers are the default when available, but being explicit (and
+    warning if a slow SentencePiece fallback sneaks in) guards against a
+    silent multi-x tokenization slowdown on large comment batches.
+    """
+    tokenizer = AutoTokenizer.from_pretrained(model_id, cache_dir=CACHE_DIR, use_fast=True)
+    if not getattr(tokenizer, "is_fast", False):
+        print(f"Warning: fast tokenizer unavailable for {model_id}; using the slow Python one.")
+    return tokenizer
+
+
+def _load_model(auto_class, model_id, **extra):
+    """Loads model weights, degrading gracefully from the optimized path.
+
+    low_cpu_mem_usage needs accelerate installed and use_safetensors needs
+    the checkpoint to actually ship safetensors files; neither is guaranteed,
+    so a failed optimized load falls back to the plain from_pretrained that
+    always worked rather than taking the whole scraper down at import.
+    """
+    try:
+        return auto_class.from_pretrained(model_id, cache_dir=CACHE_DIR, **extra, **MODEL_LOAD_KWARGS)
+    except Exception as e:
+        print(f"Optimized weight load failed for {model_id} ({e}); using the standard loader.")
+        return auto_class.from_pretrained(model_id, cache_dir=CACHE_DIR, **extra)
+
+
+def _build_sentiment_pipeline():
+    kwargs = dict(batch_size=SENTIMENT_BATCH_SIZE, truncation=True, use_fast=True)
+
+    if DEVICE == -1:
+        # On CPU, int8 dynamic quantization of the Linear layers gives a
+        # multi-x throughput win on VNNI-capable hardware with negligible
+        # accuracy loss for 3-class sentiment.
+        try:
+            tokenizer = _load_fast_tokenizer(SENT_MODEL_ID)
+            model = _load_model(AutoModelForSequenceClassification, SENT_MODEL_ID)
+            model = torch.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+            return pipeline("sentiment-analysis", model=model, tokenizer=tokenizer, **kwargs)
+        except Exception as e:
+            # Last resort: the baseline load without any optimized kwargs.
+            print(f"int8 quantization failed ({e}); using fp32 CPU pipeline.")
+            return pipeline("sentiment-analysis", model=SENT_MODEL_ID, cache_dir=CACHE_DIR, **kwargs)
+
+    try:
+        return pipeline(
+            "sentiment-analysis",
+            model=SENT_MODEL_ID,
+            cache_dir=CACHE_DIR,
+            device=DEVICE,
+            torch_dtype=TORCH_DTYPE,
+            model_kwargs=MODEL_LOAD_KWARGS,
+            **kwargs,
+        )
+    except Exception as e:
+        # Last resort: the baseline load without any optimized kwargs.
+        print(f"GPU sentiment pipeline failed ({e}); retrying on CPU.")
+        return pipeline("sentiment-analysis", model=SENT_MODEL_ID, cache_dir=CACHE_DIR, **kwargs)
+
+
 print("Loading ADVANCED multilingual sentiment model...")
-sentiment_pipeline = pipeline("sentiment-analysis", model=SENT_MODEL_ID, cache_dir=CACHE_DIR)
+sentiment_pipeline = _build_sentiment_pipeline()
 
 print("Loading STATE-OF-THE-ART multilingual summarization model...")
 try:
-    summarization_tokenizer = AutoTokenizer.from_pretrained(SUMM_MODEL_ID, cache_dir=CACHE_DIR)
-    summarization_model = AutoModelForSeq2SeqLM.from_pretrained(SUMM_MODEL_ID, cache_dir=CACHE_DIR)
-    summarizer = pipeline("summarization", model=summarization_model, tokenizer=summarization_tokenizer)
+    summarization_tokenizer = _load_fast_tokenizer(SUMM_MODEL_ID)
+    # mT5 checkpoints leave model_max_length effectively unbounded, so the
+    # pipeline's truncation=True would not cap anything without this: pin it
+    # to the 512-token budget so long inputs are actually truncated.
+    summarization_tokenizer.model_max_length = SUMMARY_MAX_INPUT_TOKENS
+    summarization_model = _load_model(AutoModelForSeq2SeqLM, SUMM_MODEL_ID, torch_dtype=TORCH_DTYPE)
+    summarizer = pipeline(
+        "summarization",
+        model=summarization_model,
+        tokenizer=summarization_tokenizer,
+        device=DEVICE,
+    )
     print("Summarization model loaded successfully.")
 except Exception as e:
     print(f"Failed to load summarization model. Summarization will be skipped. Error: {e}")
     summarizer = None
 
 # --- PROCESSING FUNCTION ---
+def run_sentiment_batched(entries):
+    """Runs the sentiment pipeline over all analyzable comments in one batched call.
+
+    Returns a dict mapping entry index -> prediction; junk entries are skipped
+    and pipeline failures simply leave indices absent (callers fall back to
+    neutral), matching the old per-comment error handling.
+    """
+    predictions = {}
+    misses = []
+    for i, text in enumerate(entries):
+        if is_junk_or_boilerplate(text):
+            continue
+        cached = SENTIMENT_CACHE.get(_cache_key(text))
+        if cached:
+            predictions[i] = {'label': cached[0], 'score': cached[1]}
+        else:
+            misses.append(i)
+
+    if misses:
+        # MyGov threads are heavy with templated responses; clustering by
+        # normalized text runs the transformer once per cluster and
+        # broadcasts the label to every member.
+        clusters = {}
+        for i in misses:
+            clusters.setdefault(_near_dup_key(entries[i]), []).append(i)
+        cluster_members = list(clusters.values())
+
+        try:
+            with torch.inference_mode():
+                fresh = sentiment_pipeline(
+                    [entries[members[0]][:512] for members in cluster_members],
+                    batch_size=SENTIMENT_BATCH_SIZE,
+                )
+        except Exception:
+            fresh = []
+        for members, prediction in zip(cluster_members, fresh):
+            for i in members:
+                predictions[i] = prediction
+                SENTIMENT_CACHE[_cache_key(entries[i])] = (prediction['label'], prediction['score'])
+
+    return predictions
+
+
+def run_summarization_batched(entries):
+    """Summarizes long comments in length-bucketed batches.
+
+    Sorting candidates by token length before batching keeps padding waste
+    low (mT5 attention cost grows with the padded length), so each batch of
+    SUMMARY_BATCH_SIZE decodes sequences of similar size. Returns a dict
+    mapping entry index -> summary text; entries that fail or are too short
+    are simply absent.
+    """
+    if summarizer is None:
+        return {}
+
+    # Only comments long enough that a summary actually condenses anything
+    # are worth an mT5 forward pass; everything shorter keeps its own text.
+    candidates = [
+        (idx, "summarize: " + text)
+        for idx, text in enumerate(entries)
+        if text and len(text.split()) > SUMMARY_MIN_WORDS
+    ]
+    if not candidates:
+        return {}
+
+    try:
+        lengths = summarization_tokenizer(
+            [text for _, text in candidates], truncation=True, max_length=SUMMARY_MAX_INPUT_TOKENS
+        )["input_ids"]
+        lengths = [len(ids) for ids in lengths]
+    except Exception:
+        lengths = [len(text.split()) for _, text in candidates]
+
+    order = sorted(range(len(candidates)), key=lambda k: lengths[k])
+
+    summaries = {}
+    for start in range(0, len(order), SUMMARY_BATCH_SIZE):
+        bucket = order[start:start + SUMMARY_BATCH_SIZE]
+        bucket_texts = [candidates[k][1] for k in bucket]
+        try:
+            # Greedy decode (num_beams=1) with inputs truncated to 512
+            # tokens: attention is O(L^2) and the dashboard does not need
+            # beam-search quality summaries.
+            with torch.inference_mode():
+                outputs = summarizer(
+                    bucket_texts,
+                    batch_size=SUMMARY_BATCH_SIZE,
+                    max_length=150,
+                    min_length=20,
+                    do_sample=False,
+                    num_beams=1,
+                    truncation=True,
+                )
+        except Exception:
+            continue
+        for k, output in zip(bucket, outputs):
+            idx = candidates[k][0]
+            summaries[idx] = output.get('summary_text', entries[idx])
+
+    return summaries
+
+
+CSV_FIELDNAMES = ["author", "timestamp", "text", "lang", "sentiment", "sentiment_score", "summary"]
+
+
 def process_and_predict(comments):
-    """Processes comments, performs sentiment analysis, summarization, and language detection."""
-    rows = []
-    for c in tqdm(comments, desc="Running state-of-the-art analysis"):
-        text = c.get("text", "").strip()
+    """Processes comments, performs sentiment analysis, summarization, and language detection.
+
+    Yields one row dict per comment so the caller can stream rows straight
+    to disk instead of holding the full result set in memory.
+    """
+    entries = [c.get("text", "").strip() for c in comments]
+    predictions = run_sentiment_batched(entries)
+    summaries = run_summarization_batched(entries)
+
+    for idx, c in enumerate(tqdm(comments, desc="Running state-of-the-art analysis")):
+        text = entries[idx]
         if not text: continue
 
         sentiment, score, lang_code = "neutral", 0.5, "unknown"
@@ -81,30 +440,21 @@ def process_and_predict(comments):
         if is_junk_or_boilerplate(text):
             lang_code = "N/A"
         else:
-            try:
-                lang_code = detect(text)
-                prediction = sentiment_pipeline(text[:512])[0]
+            prefix = text[:256]
+            lang_code = LANG_CACHE.get(prefix)
+            if lang_code is None:
+                lang_code = detect_language_code(text)
+                LANG_CACHE[prefix] = lang_code
+            prediction = predictions.get(idx)
+            if prediction:
                 sentiment = prediction['label'].lower()
                 score = prediction['score']
-            except LangDetectException:
-                lang_code = "unknown"
-            except Exception:
-                sentiment, score = "neutral", 0.5
 
         lang_full_name = get_language_full_name(lang_code)
 
-        summary = ""
-        if summarizer and len(text.split()) > 25:
-            try:
-                summary_input = "summarize: " + text
-                s = summarizer(summary_input, max_length=150, min_length=20, do_sample=False)
-                summary = s[0].get('summary_text', text)
-            except Exception:
-                summary = text
-        else:
-            summary = text
+        summary = summaries.get(idx, text)
 
-        rows.append({
+        yield {
             "author": c.get("author", "Unknown"),
             "timestamp": "",
             "text": text,
@@ -112,27 +462,77 @@ def process_and_predict(comments):
             "sentiment": sentiment,
             "sentiment_score": score,
             "summary": summary
-        })
-    return rows
+        }
 
 # --- SCRAPING AND MAIN EXECUTION ---
-def scrape_comments_selenium(url: str):
-    """Scrapes comments from a MyGov URL using Selenium to handle JavaScript-rendered content."""
-    print("Initializing Selenium WebDriver...")
-    
-    # Setup Chrome options
+# soupsieve ships with bs4; pre-compiling the multi-selector patterns once
+# avoids re-parsing the selector strings for every comment block.
+_AUTHOR_SEL = sv.compile(
+    "div.comment_user, div.comment-user, span.author, a.username, div.post-author, div.user, .comment-author"
+)
+_BODY_SEL = sv.compile(
+    "div.comment_body, div.comment-body, div.field--name-field-comments, div.field-name-body, div.views-field-body, div.field-item, p, article"
+)
+
+
+# webdriver_manager phones home to check for driver updates on every
+# install() call. The resolved binary path is cached on disk and only
+# re-resolved weekly, so repeat runs skip the network round-trip entirely.
+CHROMEDRIVER_PATH_CACHE = os.path.join(os.path.expanduser("~"), ".cache", "mygov", "chromedriver_path")
+CHROMEDRIVER_CACHE_MAX_AGE = 7 * 24 * 3600
+
+
+def _resolve_chromedriver_path():
+    try:
+        if os.path.exists(CHROMEDRIVER_PATH_CACHE):
+            age = time.time() - os.path.getmtime(CHROMEDRIVER_PATH_CACHE)
+            if age < CHROMEDRIVER_CACHE_MAX_AGE:
+                with open(CHROMEDRIVER_PATH_CACHE, "r", encoding="utf-8") as fh:
+                    path = fh.read().strip()
+                if path and os.path.exists(path):
+                    return path
+    except Exception:
+        pass
+
+    path = ChromeDriverManager().install()
+    try:
+        os.makedirs(os.path.dirname(CHROMEDRIVER_PATH_CACHE), exist_ok=True)
+        with open(CHROMEDRIVER_PATH_CACHE, "w", encoding="utf-8") as fh:
+            fh.write(path)
+    except Exception as e:
+        print(f"Warning: could not cache chromedriver path: {e}")
+    return path
+
+
+def create_webdriver():
+    """Creates a headless Chrome WebDriver configured for MyGov scraping."""
     chrome_options = ChromeOptions()
     chrome_options.add_argument('--headless')  # Run in headless mode (no GUI)
     chrome_options.add_argument('--no-sandbox')
     chrome_options.add_argument('--disable-dev-shm-usage')
     chrome_options.add_argument('--disable-blink-features=AutomationControlled')
     chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
-    
+
+    service = Service(_resolve_chromedriver_path())
+    return webdriver.Chrome(service=service, options=chrome_options)
+
+
+def scrape_comments_selenium(url: str, driver=None):
+    """Scrapes comments from a MyGov URL using Selenium to handle JavaScript-rendered content.
+
+    Pass an existing driver to skip the 1-2s browser cold start when scraping
+    several URLs in a row; the caller then owns (and must quit) the driver.
+    """
+    owns_driver = driver is None
+
     try:
-        # Initialize driver
-        service = Service(ChromeDriverManager().install())
-        driver = webdriver.Chrome(service=service, options=chrome_options)
-        
+        if owns_driver:
+            print("Initializing Selenium WebDriver...")
+            driver = create_webdriver()
+        else:
+            print("Reusing warm Selenium WebDriver...")
+            driver.delete_all_cookies()
+
         print(f"Navigating to URL: {url}")
         driver.get(url)
         
@@ -145,34 +545,45 @@ def scrape_comments_selenium(url: str):
             )
         except:
             print("Warning: Comments took longer to load or may not be available.")
-        
-        # Additional wait to ensure all comments are rendered
-        time.sleep(3)
-        
-        # Scroll to load more comments if lazy loading exists
-        last_height = driver.execute_script("return document.body.scrollHeight")
+
+        # Scroll to load more comments if lazy loading exists. Instead of a
+        # fixed sleep per scroll, wait on an explicit condition: either more
+        # comment rows appeared or the page height stopped changing.
+        stale_iterations = 0
         for _ in range(5):  # Try scrolling 5 times
+            prev_count = len(driver.find_elements(By.CSS_SELECTOR, "div.views-row"))
+            last_height = driver.execute_script("return document.body.scrollHeight")
             driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            new_height = driver.execute_script("return document.body.scrollHeight")
-            if new_height == last_height:
-                break
-            last_height = new_height
-        
+            try:
+                WebDriverWait(driver, 5).until(
+                    lambda d: len(d.find_elements(By.CSS_SELECTOR, "div.views-row")) > prev_count
+                    or d.execute_script("return document.body.scrollHeight") > last_height
+                )
+            except Exception:
+                pass
+            new_count = len(driver.find_elements(By.CSS_SELECTOR, "div.views-row"))
+            if new_count <= prev_count:
+                stale_iterations += 1
+                if stale_iterations >= 2:
+                    break
+            else:
+                stale_iterations = 0
+
         # Get the page source and parse with BeautifulSoup
         page_source = driver.page_source
-        driver.quit()
-        
+
     except Exception as e:
         print(f"Error with Selenium: {e}")
-        try:
-            driver.quit()
-        except:
-            pass
         return []
+    finally:
+        if owns_driver and driver is not None:
+            try:
+                driver.quit()
+            except:
+                pass
     
     # Parse the rendered HTML
-    soup = BeautifulSoup(page_source, "html.parser")
+    soup = BeautifulSoup(page_source, BS4_PARSER)
     results = []
     processed_texts = set()
     
@@ -202,32 +613,29 @@ def scrape_comments_selenium(url: str):
             # Extract author name
             # Try multiple selectors for author
             author = "Unknown"
-            author_elem = block.select_one(
-                "div.comment_user, div.comment-user, span.author, a.username, div.post-author, div.user, .comment-author"
-            )
+            author_text = ""
+            author_elem = _AUTHOR_SEL.select_one(block)
             if author_elem:
                 author_text = author_elem.get_text(separator=" ", strip=True)
                 author = author_text.split('\n')[0].strip() if author_text else "Unknown"
-            
-            # Extract comment text: try common selectors then fallback to block text
-            text_selectors = (
-                "div.comment_body, div.comment-body, div.field--name-field-comments, div.field-name-body, div.views-field-body, div.field-item, p, article"
-            )
-            text_elem = block.select_one(text_selectors)
+
+            # Extract comment text: try common selectors then fallback to the
+            # block's own text. get_text walks the whole subtree, so the full
+            # block walk only happens when no body element matched.
+            text_elem = _BODY_SEL.select_one(block)
             if text_elem:
                 text_content = text_elem.get_text(separator=" ", strip=True)
             else:
-                # Fallback: use the block's visible text but remove author text if present
-                raw = block.get_text(separator=" ", strip=True)
-                if author and author in raw:
-                    text_content = raw.replace(author, "").strip()
+                block_text = block.get_text(separator=" ", strip=True)
+                if author_text and author_text in block_text:
+                    text_content = block_text.replace(author_text, "").strip()
                 else:
-                    text_content = raw
+                    text_content = block_text
             
             # Clean up and validate
             if text_content:
                 # Remove repeated whitespace and very long metadata lines
-                text_content = re.sub(r"\s+", " ", text_content).strip()
+                text_content = _WS_RE.sub(" ", text_content).strip()
             if text_content and text_content not in processed_texts and not is_junk_or_boilerplate(text_content):
                 results.append({"author": author, "text": text_content})
                 processed_texts.add(text_content)
@@ -239,33 +647,46 @@ def scrape_comments_selenium(url: str):
     print(f"Successfully extracted {len(results)} valid comments.")
     return results
 
-def main(url=None):
-    """Main function to orchestrate the scraping and analysis."""
+def main(url=None, driver=None, comments=None):
+    """Main function to orchestrate the scraping and analysis.
+
+    Pre-scraped comments can be passed in (e.g. when several URLs were
+    scraped in parallel); in that case the Selenium step is skipped.
+    """
     if url is None:
         raise ValueError("A URL must be provided.")
-    
+
     print("-" * 50)
     print(f"Starting scrape for URL: {url}")
-    
-    # Use Selenium for dynamic content
-    comments = scrape_comments_selenium(url)
-    
+
+    # Use Selenium for dynamic content unless the caller already scraped
+    if comments is None:
+        comments = scrape_comments_selenium(url, driver=driver)
+
     if not comments:
         print("No valid comments found to process.")
         return
 
-    rows = process_and_predict(comments)
-    if not rows:
+    # Stream rows straight to the CSV as they are produced; no list or
+    # DataFrame round-trip, so peak memory stays flat for large scrapes.
+    output_path = os.path.join("outputs", "comments_processed.csv")
+    n_rows = 0
+    with open(output_path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=CSV_FIELDNAMES)
+        writer.writeheader()
+        for row in process_and_predict(comments):
+            writer.writerow(row)
+            n_rows += 1
+            if n_rows % 100 == 0:
+                f.flush()
+
+    if not n_rows:
         print("Processing did not yield any valid rows.")
         return
-        
-    df = pd.DataFrame(rows)
-    
-    # Temporarily save the processed file
-    output_path = os.path.join("outputs", "comments_processed.csv")
-    df.to_csv(output_path, index=False)
-    
-    print(f"Scraping and analysis complete. {len(df)} comments saved to {output_path}")
+
+    save_result_caches()
+
+    print(f"Scraping and analysis complete. {n_rows} comments saved to {output_path}")
     print("-" * 50)
 
 if __name__ == '__main__':
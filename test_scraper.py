@@ -2,6 +2,12 @@ import requests
 from bs4 import BeautifulSoup
 import json
 
+try:
+    import lxml  # noqa: F401
+    BS4_PARSER = "lxml"
+except Exception:
+    BS4_PARSER = "html.parser"
+
 url = "https://www.mygov.in/group-issue/inviting-ideas-mann-ki-baat-prime-minister-narendra-modi-28th-september-2025/"
 
 print("Fetching URL...")
@@ -9,7 +15,7 @@ r = requests.get(url, headers={"User-Agent": "Mozilla/5.0"}, timeout=15)
 print(f"Status Code: {r.status_code}")
 print(f"Content Length: {len(r.text)} chars")
 
-soup = BeautifulSoup(r.text, "html.parser")
+soup = BeautifulSoup(r.text, BS4_PARSER)
 
 # Check for various possible comment selectors
 print("\n=== Looking for comment containers ===")